@@ -0,0 +1,43 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..config import settings
+from ..logger import get_logger
+from ..observability.metrics import record_error
+
+logger = get_logger(__name__)
+
+# room for the multipart boundary and part headers around the image itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    reject uploads by their declared content-length before the body is read
+
+    fastapi parses the whole multipart form before the handler runs, so the
+    handler's own size check only fires after the payload was transferred and spooled
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.max_body_size = settings.max_image_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_size:
+                        logger.warning(
+                            "request body too large", size=int(value), max=self.max_body_size
+                        )
+                        record_error("image_too_large")
+                        response = JSONResponse(
+                            {"detail": f"request too large: {int(value)} bytes"},
+                            status_code=413,
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -1,15 +1,18 @@
 import asyncio
-import base64
-import json
+import contextvars
+import functools
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Annotated
 
 import cv2
 import numpy as np
+import orjson
 import redis.asyncio as redis
 from fastapi import APIRouter, File, HTTPException, Query, Response, UploadFile
 
 from ...config import settings
-from ...dependencies import AlignerServiceDep
+from ...dependencies import AlignerServiceDep, StorageClientDep
 from ...logger import get_logger
 from ...models import AlignmentConfig
 from ...observability.metrics import (
@@ -20,50 +23,142 @@ from ...observability.metrics import (
     record_request,
 )
 from ...observability.telemetry import get_tracer
-from ...platform.storage import get_storage_client
+from ...platform.storage import StorageClient
 
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["aligner"])
 
+ALIGNMENT_MODES = frozenset({"classic", "neural"})
+
+# the ocr-prep output is a thresholded 0/255 image: a 1-bit png is lossless, encodes
+# as fast as jpeg and comes out an order of magnitude smaller
+PREPROCESSED_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_BILEVEL, 1]
+
+# the warped image feeds the ocr engines; opencv defaults to quality 95, 90 keeps
+# glyph edges intact while encoding faster and shipping a third fewer bytes
+WARPED_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 90, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# debug previews only need to be viewable
+DEBUG_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 75, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+
+def _encode_debug_image(img: np.ndarray) -> np.ndarray | None:
+    """downscale and encode one debug image, cpu bound, runs in the alignment pool"""
+    # full-size steps dominate debug upload bytes, the event keeps the original size
+    longest = max(img.shape[:2])
+    if longest > settings.debug_image_max_edge:
+        scale = settings.debug_image_max_edge / longest
+        img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    is_success, encoded_buffer = cv2.imencode(".jpg", img, DEBUG_JPEG_PARAMS)
+    return encoded_buffer if is_success else None
+
+
+async def _store_debug_image(
+    executor: ThreadPoolExecutor,
+    upload_executor: ThreadPoolExecutor,
+    storage_client: StorageClient,
+    image_key: str,
+    img: np.ndarray,
+) -> bool:
+    """encode one debug image in the alignment pool, upload it from the upload pool"""
+    loop = asyncio.get_running_loop()
+
+    encoded_buffer = await loop.run_in_executor(executor, _encode_debug_image, img)
+    if encoded_buffer is None:
+        logger.warning("failed to encode debug image", key=image_key)
+        return False
+
+    # the put blocks on minio, keep that wait off the alignment workers
+    stored = await loop.run_in_executor(
+        upload_executor, storage_client.put_object, image_key, encoded_buffer.tobytes()
+    )
+    if not stored:
+        logger.warning("failed to upload debug image", key=image_key)
+        return False
+
+    return True
+
+
+async def _publish_debug_events(
+    redis_client: redis.Redis, pending: list[tuple[Future, bytes]]
+) -> None:
+    """wait for debug uploads, then publish events of the stored ones in one pipeline"""
+    # one snapshot drives both the gather and the pairing, so results always line up
+    # with their payloads even if the caller's list keeps growing meanwhile
+    snapshot = list(pending)
+    uploaded = await asyncio.gather(
+        *(asyncio.wrap_future(upload) for upload, _ in snapshot), return_exceptions=True
+    )
+
+    events = []
+    for (_, payload), result in zip(snapshot, uploaded, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("failed to process debug step", error=str(result))
+        elif result:
+            events.append(payload)
+
+    if not events:
+        return
 
-@router.post("/align")
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for payload in events:
+                pipe.publish("ocr:events", payload)
+            await pipe.execute()
+        logger.debug("published debug events", count=len(events))
+    except Exception as e:
+        logger.error("failed to publish debug events", error=str(e), count=len(events))
+
+
+# warped jpeg and preprocessed png are returned back to back as raw bytes,
+# x-warped-length marks where the first one ends
+@router.post(
+    "/align",
+    response_class=Response,
+    responses={200: {"content": {"application/octet-stream": {}}}},
+)
 async def align_image(
-    image: UploadFile = File(...),
-    mode: str = Query(
-        default="classic",
-        description="alignment mode: 'classic' for opencv or 'neural' for docaligner",
-    ),
-    aggressive: bool = Query(
-        default=False,
-        description="aggressive preprocessing mode (sharp edges, may lose thin details)",
-    ),
-    apply_ocr_prep: bool = Query(
-        default=False, description="apply ocr binarization after alignment"
-    ),
-    simplify_percent: float = Query(
-        default=2.0,
-        ge=0.1,
-        le=10.0,
-        description="polygon simplification as % of perimeter (scale-independent, classic mode only)",
-    ),
-    debug_mode: bool = Query(
-        default=False, description="enable debug mode with intermediate image saves"
-    ),
-    recognition_id: str = Query(
-        default="", description="recognition id for tracking (required if debug_mode=true)"
-    ),
-    image_id: str = Query(default="", description="image id for tracking"),
-    aligner_deps: AlignerServiceDep = None,
+    image: Annotated[UploadFile, File()],
+    aligner_deps: AlignerServiceDep,
+    debug_storage: StorageClientDep,
+    mode: Annotated[
+        str,
+        Query(description="alignment mode: 'classic' for opencv or 'neural' for docaligner"),
+    ] = "classic",
+    aggressive: Annotated[
+        bool,
+        Query(description="aggressive preprocessing mode (sharp edges, may lose thin details)"),
+    ] = False,
+    apply_ocr_prep: Annotated[
+        bool, Query(description="apply ocr binarization after alignment")
+    ] = False,
+    simplify_percent: Annotated[
+        float,
+        Query(
+            ge=0.1,
+            le=10.0,
+            description="polygon simplification as % of perimeter (scale-independent, classic mode only)",
+        ),
+    ] = 2.0,
+    debug_mode: Annotated[
+        bool, Query(description="enable debug mode with intermediate image saves")
+    ] = False,
+    recognition_id: Annotated[
+        str, Query(description="recognition id for tracking (required if debug_mode=true)")
+    ] = "",
+    image_id: Annotated[str, Query(description="image id for tracking")] = "",
 ):
-    aligner_service, _ = aligner_deps
-    start_time = time.time()
+    aligner_service, executor, upload_executor, debug_redis, debug_tasks = aligner_deps
+    # monotonic, unaffected by wall clock adjustments
+    start_ns = time.perf_counter_ns()
     active_alignments.inc()
 
     logger.info(f"aligner service running: {mode}")
 
-    if mode not in ["classic", "neural"]:
+    if mode not in ALIGNMENT_MODES:
         return Response(
             content=f"invalid mode: {mode}. must be 'classic' or 'neural'", status_code=400
         )
@@ -71,40 +166,35 @@ async def align_image(
     debug_callback = None
     redis_client = None
     storage_client = None
+    # (upload future, serialized event) per debug step
+    debug_events: list[tuple[Future, bytes]] = []
+    loop = asyncio.get_running_loop()
 
     if debug_mode:
         if not recognition_id:
             logger.warning("debug mode requested without recognition_id")
             return Response(content="recognition_id required when debug_mode=true", status_code=400)
 
-        try:
-            redis_client = await redis.from_url(settings.redis_url, decode_responses=False)
-            logger.debug("connected to redis for debug events")
-        except Exception as e:
-            logger.warning("failed to connect to redis for debug", error=str(e))
+        # shared pool, connections are reused across debug requests
+        redis_client = debug_redis
 
-        try:
-            storage_client = get_storage_client()
-            logger.debug("got storage client for debug images")
-        except Exception as e:
-            logger.warning("failed to get storage client for debug", error=str(e))
+        # built in lifespan, the minio client and its connection pool are shared
+        storage_client = debug_storage
 
-        async def debug_callback_func(step: str, step_num: int, img: np.ndarray, metadata: dict):
+        def debug_callback_func(step: str, step_num: int, img: np.ndarray, metadata: dict):
+            # called on the alignment thread, the upload is handed over to the event loop
             if not redis_client or not storage_client:
                 return
 
             try:
-                is_success, encoded_buffer = cv2.imencode(".jpg", img)
-                if not is_success:
-                    logger.warning("failed to encode debug image", step=step)
-                    return
-
                 image_key = f"debug/{recognition_id}/{step_num:02d}_{step}.jpg"
-                storage_url = storage_client.put_object(image_key, encoded_buffer.tobytes())
 
-                if not storage_url:
-                    logger.warning("failed to upload debug image", step=step)
-                    return
+                # encode and upload while alignment carries on,
+                # storage puts of different steps overlap instead of queueing
+                upload = asyncio.run_coroutine_threadsafe(
+                    _store_debug_image(executor, upload_executor, storage_client, image_key, img),
+                    loop,
+                )
 
                 event_data = {
                     "event": "aligner.debug.step",
@@ -114,22 +204,27 @@ async def align_image(
                     "stepNumber": step_num,
                     "imageKey": image_key,
                     "description": metadata.get("description", step),
-                    "metadata": {k: v for k, v in metadata.items() if k != "description"},
+                    "metadata": {
+                        **{k: v for k, v in metadata.items() if k != "description"},
+                        # stored image may be downscaled, metadata coordinates use this full size
+                        "image_width": img.shape[1],
+                        "image_height": img.shape[0],
+                    },
                     "timestamp": time.time() * 1000,  # milliseconds for consistency with typescript
                 }
 
-                await redis_client.publish("ocr:events", json.dumps(event_data))
-                logger.debug(
-                    "published debug event", step=step, recognition_id=recognition_id, key=image_key
-                )
+                # published together once alignment is done, one round-trip per request
+                # orjson emits bytes redis can publish as-is and handles numpy scalars
+                payload = orjson.dumps(event_data, option=orjson.OPT_SERIALIZE_NUMPY)
+                debug_events.append((upload, payload))
             except Exception as e:
                 logger.error("failed to process debug step", error=str(e), step=step)
 
         debug_callback = debug_callback_func
 
     try:
-        contents = await image.read()
-        file_size = len(contents)
+        # starlette has already spooled the upload, check its size before reading it
+        file_size = image.size
 
         if file_size > settings.max_image_size:
             logger.warning("image too large", size=file_size, max=settings.max_image_size)
@@ -142,8 +237,14 @@ async def align_image(
         record_image_size(file_size)
 
         try:
-            nparr = np.frombuffer(contents, np.uint8)
-            img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # read straight into one preallocated buffer instead of an intermediate bytes.
+            # the spooled file may sit on disk, so the read goes to the service pool too
+            nparr = np.empty(file_size, np.uint8)
+            read_size = await loop.run_in_executor(executor, image.file.readinto, nparr)
+            # libjpeg work releases the gil, keep it off the event loop
+            img = await loop.run_in_executor(
+                executor, cv2.imdecode, nparr[:read_size], cv2.IMREAD_COLOR
+            )
             if img is None:
                 raise ValueError("failed to decode image")
         except Exception as e:
@@ -152,16 +253,22 @@ async def align_image(
             raise HTTPException(status_code=400, detail=f"invalid image format: {str(e)}") from None
 
         with tracer.start_as_current_span("api.align") as span:
-            span.set_attribute("image.size_bytes", file_size)
-            span.set_attribute("image.width", img.shape[1])
-            span.set_attribute("image.height", img.shape[0])
-            span.set_attribute("config.mode", mode)
-            span.set_attribute("preprocessing.aggressive", aggressive)
-            span.set_attribute("preprocessing.apply_ocr_prep", apply_ocr_prep)
-            span.set_attribute("debug.enabled", debug_mode)
+            # sampled-out and disabled-telemetry spans drop attributes, skip building them
+            if span.is_recording():
+                span.set_attributes(
+                    {
+                        "image.size_bytes": file_size,
+                        "image.width": img.shape[1],
+                        "image.height": img.shape[0],
+                        "config.mode": mode,
+                        "preprocessing.aggressive": aggressive,
+                        "preprocessing.apply_ocr_prep": apply_ocr_prep,
+                        "debug.enabled": debug_mode,
+                    }
+                )
 
             try:
-                config = AlignmentConfig(
+                config = AlignmentConfig.for_request(
                     mode=mode,
                     simplify_percent=simplify_percent,
                     apply_ocr_preprocessing=apply_ocr_prep,
@@ -170,8 +277,18 @@ async def align_image(
                     recognition_id=recognition_id,
                 )
 
+                # alignment is cpu bound python and opencv, run it in the pool so the
+                # event loop keeps serving other requests. the context copy keeps the
+                # alignment spans under this request's trace
+                align_call = functools.partial(
+                    contextvars.copy_context().run,
+                    aligner_service.align,
+                    img,
+                    config,
+                    debug_callback,
+                )
                 warped, preprocessed = await asyncio.wait_for(
-                    aligner_service.align(img, config, debug_callback),
+                    loop.run_in_executor(executor, align_call),
                     timeout=settings.processing_timeout,
                 )
             except TimeoutError:
@@ -185,41 +302,45 @@ async def align_image(
                     status_code=500, detail=f"alignment processing failed: {str(e)}"
                 ) from e
 
-            success_warped, buffer_warped = cv2.imencode(".jpg", warped)
+            # both encodes release the gil, run them side by side in the pool
+            (success_warped, buffer_warped), (success_prep, buffer_prep) = await asyncio.gather(
+                loop.run_in_executor(executor, cv2.imencode, ".jpg", warped, WARPED_JPEG_PARAMS),
+                loop.run_in_executor(
+                    executor, cv2.imencode, ".png", preprocessed, PREPROCESSED_PNG_PARAMS
+                ),
+            )
             if not success_warped:
                 raise Exception("failed to encode warped image")
 
-            success_prep, buffer_prep = cv2.imencode(".jpg", preprocessed)
             if not success_prep:
                 raise Exception("failed to encode preprocessed image")
 
-            warped_bytes = buffer_warped.tobytes()
-            preprocessed_bytes = buffer_prep.tobytes()
-
-            span.set_attribute("output.warped_size_bytes", len(warped_bytes))
-            span.set_attribute("output.preprocessed_size_bytes", len(preprocessed_bytes))
+            if span.is_recording():
+                span.set_attribute("output.warped_size_bytes", buffer_warped.nbytes)
+                span.set_attribute("output.preprocessed_size_bytes", buffer_prep.nbytes)
 
-        processing_time = (time.time() - start_time) * 1000
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        processing_time = elapsed_ns / 1e6
 
-        record_duration(processing_time / 1000)
+        record_duration(elapsed_ns / 1e9)
         record_request("success")
 
         logger.info(
             "alignment completed",
             mode=mode,
             file_size=file_size,
-            warped_size=len(warped_bytes),
-            preprocessed_size=len(preprocessed_bytes),
+            warped_size=buffer_warped.nbytes,
+            preprocessed_size=buffer_prep.nbytes,
             processing_time_ms=round(processing_time, 2),
             debug_mode=debug_mode,
         )
 
-        response_data = {
-            "warped": base64.b64encode(warped_bytes).decode("utf-8"),
-            "preprocessed": base64.b64encode(preprocessed_bytes).decode("utf-8"),
-        }
-
-        return response_data
+        # one copy of the encoded buffers into the body, no base64 or json
+        return Response(
+            content=b"".join((buffer_warped, buffer_prep)),
+            media_type="application/octet-stream",
+            headers={"X-Warped-Length": str(buffer_warped.nbytes)},
+        )
 
     except HTTPException:
         raise
@@ -229,5 +350,10 @@ async def align_image(
         raise HTTPException(status_code=500, detail="internal server error") from e
     finally:
         active_alignments.dec()
-        if redis_client:
-            await redis_client.close()
+        if redis_client and debug_events:
+            # debug side effects are best-effort, the response does not wait for them.
+            # after a timeout the worker thread may still append steps, publish what
+            # was recorded up to here
+            task = asyncio.create_task(_publish_debug_events(redis_client, list(debug_events)))
+            debug_tasks.add(task)
+            task.add_done_callback(debug_tasks.discard)
@@ -1,4 +1,6 @@
-from pydantic import Field
+import os
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,7 +17,9 @@ class Settings(BaseSettings):
     # server
     host: str = Field(default="0.0.0.0", description="host to bind")
     port: int = Field(default=8000, ge=1, le=65535, description="port to bind")
-    workers: int = Field(default=2, ge=1, description="number of thread pool workers")
+    workers: int = Field(
+        default=0, ge=0, description="number of thread pool workers, 0 sizes it from cpu count"
+    )
 
     # alignment config
     simplify_percent: float = Field(
@@ -39,6 +43,12 @@ class Settings(BaseSettings):
     minio_secret_key: str = Field(default="minioadmin", description="minio secret key")
     minio_use_ssl: bool = Field(default=False, description="use ssl for minio")
     minio_bucket: str = Field(default="images", description="minio bucket name")
+    debug_upload_workers: int = Field(
+        default=8, ge=1, description="threads uploading debug images to minio"
+    )
+    debug_image_max_edge: int = Field(
+        default=1024, ge=1, description="longest edge debug images are downscaled to"
+    )
 
     # logging
     log_level: str = Field(default="INFO", description="logging level")
@@ -52,5 +62,12 @@ class Settings(BaseSettings):
     # metrics
     enable_metrics: bool = Field(default=True, description="enable prometheus metrics")
 
+    @field_validator("workers")
+    @classmethod
+    def _resolve_workers(cls, value: int) -> int:
+        # same default as ThreadPoolExecutor: opencv releases the gil so cpu-bound work
+        # scales with cores, the extra threads cover debug uploads blocked on network io
+        return value or min(32, (os.cpu_count() or 1) + 4)
+
 
 settings = Settings()
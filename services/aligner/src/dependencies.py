@@ -1,57 +1,101 @@
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from typing import Annotated
+from typing import Annotated, NamedTuple
 
-from fastapi import Depends
+import redis.asyncio as redis
+from fastapi import Depends, Request
 
 from .config import settings
 from .logger import get_logger
+from .observability.metrics import worker_pool_size
+from .platform.storage import StorageClient
+from .services import HybridAligner
 
 logger = get_logger(__name__)
 
 
-class AlignerServiceDependency:
-    """singleton for aligner service and thread pool"""
+class AlignerDeps(NamedTuple):
+    """aligner service, thread pools and debug redis pool, built once in lifespan"""
 
-    _service = None
-    _executor = None
+    service: HybridAligner
+    executor: ThreadPoolExecutor
+    upload_executor: ThreadPoolExecutor
+    redis: redis.Redis
+    # strong refs to in-flight debug flushes, the loop only keeps weak ones
+    debug_tasks: set[asyncio.Task]
 
-    @classmethod
-    def get_instance(cls):
-        """get or create service instance"""
-        if cls._service is None:
-            from .services import HybridAligner
 
-            logger.info("creating hybrid aligner service instance")
+def create_aligner_deps() -> AlignerDeps:
+    """create service instance, thread pools and debug redis pool"""
+    logger.info("creating hybrid aligner service instance")
 
-            # initialize hybrid aligner with neural support
-            # you can configure this via environment variables if needed
-            cls._service = HybridAligner(
-                enable_neural=True,  # set to False to disable neural mode
-                neural_backend="cpu",  # or "cuda" if GPU available
-                neural_model_cfg="fastvit_sa24",  # docaligner model config
-            )
+    # initialize hybrid aligner with neural support
+    # you can configure this via environment variables if needed
+    service = HybridAligner(
+        enable_neural=True,  # set to False to disable neural mode
+        neural_backend="cpu",  # or "cuda" if GPU available
+        neural_model_cfg="fastvit_sa24",  # docaligner model config
+    )
 
-            cls._executor = ThreadPoolExecutor(max_workers=settings.workers)
-            logger.info("hybrid aligner service created", workers=settings.workers)
+    executor = ThreadPoolExecutor(max_workers=settings.workers)
+    worker_pool_size.set(settings.workers)
 
-        return cls._service, cls._executor
+    # debug uploads wait on minio, a separate pool keeps them from holding alignment workers
+    upload_executor = ThreadPoolExecutor(
+        max_workers=settings.debug_upload_workers, thread_name_prefix="debug-upload"
+    )
 
-    @classmethod
-    def shutdown(cls):
-        """cleanup"""
-        if cls._executor:
-            logger.info("shutting down thread pool")
-            cls._executor.shutdown(wait=True)
+    # pooled and lazy, nothing connects until the first debug request.
+    # keepalive and periodic health checks so idle sockets are not dropped
+    # silently by nat or the server between sparse debug runs
+    debug_redis = redis.from_url(
+        settings.redis_url,
+        decode_responses=False,
+        max_connections=32,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+    logger.info("hybrid aligner service created", workers=settings.workers)
 
-        if cls._service:
-            logger.info("shutting down hybrid aligner service")
-            cls._service.shutdown()
+    return AlignerDeps(service, executor, upload_executor, debug_redis, set())
 
 
-def get_aligner_service():
-    """dependency injection for fastapi endpoints"""
-    service, executor = AlignerServiceDependency.get_instance()
-    return service, executor
+async def close_aligner_deps(deps: AlignerDeps) -> None:
+    """cleanup"""
+    # debug flushes still need redis and the upload pool, let them finish first
+    if deps.debug_tasks:
+        logger.info("waiting for debug flushes", pending=len(deps.debug_tasks))
+        await asyncio.gather(*deps.debug_tasks, return_exceptions=True)
 
+    logger.info("closing debug redis pool")
+    await deps.redis.aclose()
 
-AlignerServiceDep = Annotated[tuple, Depends(get_aligner_service)]
+    # before the service teardown, so nothing queued runs against a torn down aligner.
+    # queued jobs are dropped, only the ones already running are waited for
+    logger.info("shutting down thread pool")
+    deps.executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info("shutting down debug upload pool")
+    deps.upload_executor.shutdown(wait=True, cancel_futures=True)
+
+    logger.info("shutting down hybrid aligner service")
+    deps.service.shutdown()
+
+
+async def get_aligner_service(request: Request) -> AlignerDeps:
+    """
+    dependency injection for fastapi endpoints
+
+    async so fastapi calls it inline; a sync dependency is dispatched to the anyio
+    thread pool on every request just to return the instances built in lifespan
+    """
+    return request.app.state.aligner
+
+
+async def get_storage_client(request: Request) -> StorageClient | None:
+    """debug image storage built in lifespan, None when minio is unavailable"""
+    return request.app.state.storage
+
+
+AlignerServiceDep = Annotated[AlignerDeps, Depends(get_aligner_service)]
+StorageClientDep = Annotated[StorageClient | None, Depends(get_storage_client)]
@@ -1,7 +1,9 @@
 import logging
 import sys
+import time
 from typing import Any
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
@@ -17,27 +19,58 @@ def add_severity_level(_logger: Any, method_name: str, event_dict: EventDict) ->
     return event_dict
 
 
+# (second, formatted date up to that second), swapped as one tuple so threads never
+# pair a second with another second's prefix
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def add_timestamp(_logger: Any, _method_name: str, event_dict: EventDict) -> EventDict:
+    """
+    iso utc timestamp, same output as TimeStamper(fmt="iso")
+
+    the date part only changes once a second, so it is formatted once and reused;
+    per event only the microseconds are appended
+    """
+    global _second_prefix
+
+    second, fraction_ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _second_prefix = (second, prefix)
+    event_dict["timestamp"] = f"{prefix}.{fraction_ns // 1000:06d}Z"
+    return event_dict
+
+
 def configure_logging() -> None:
     """configure structlog with JSON or console output"""
 
+    # every processor runs on every emitted event. nothing here binds contextvars or
+    # logs with stack_info, so merge_contextvars and StackInfoRenderer are left out;
+    # format_exc_info stays, error paths log with exc_info=True.
+    # below-level calls never reach the chain, the filtering bound logger drops them
     shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
+        add_timestamp,
         add_severity_level,
     ]
 
     if settings.log_format == "json":
+        # orjson renders straight to bytes written to the stdout buffer, no str round-trip.
+        # numpy values are serialized natively, anything else falls back to repr
         processors = shared_processors + [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY
+            ),
         ]
+        logger_factory = structlog.BytesLoggerFactory(file=sys.stdout.buffer)
     else:
         processors = shared_processors + [
             structlog.processors.format_exc_info,
             structlog.dev.ConsoleRenderer(colors=True),
         ]
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stdout)
 
     structlog.configure(
         processors=processors,
@@ -45,7 +78,7 @@ def configure_logging() -> None:
             logging.getLevelName(settings.log_level)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
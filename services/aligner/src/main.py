@@ -1,33 +1,59 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from .api.middleware import UploadSizeLimitMiddleware
 from .api.routes import aligner, health
-from .dependencies import AlignerServiceDependency
+from .dependencies import close_aligner_deps, create_aligner_deps
 from .logger import configure_logging, get_logger
 from .observability.telemetry import configure_telemetry, instrument_app
+from .platform.storage import StorageClient
 
 configure_logging()
 logger = get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     """application lifecycle manager"""
     logger.info("starting aligner service")
 
-    # startup
+    # startup: build the aligner and storage before the first request instead of during it
     configure_telemetry()
-    AlignerServiceDependency.get_instance()
+    app.state.aligner = create_aligner_deps()
 
-    logger.info("service ready")
+    try:
+        app.state.storage = await asyncio.to_thread(_create_storage_client)
 
-    yield
+        logger.info("service ready")
 
-    # shutdown
-    logger.info("shutting down service")
-    AlignerServiceDependency.shutdown()
-    logger.info("service stopped")
+        yield
+    finally:
+        # shutdown, also when startup failed after the aligner was built
+        logger.info("shutting down service")
+        await close_aligner_deps(app.state.aligner)
+        logger.info("service stopped")
+
+
+def _create_storage_client() -> StorageClient | None:
+    """minio client for debug images, debug uploads are skipped when it is unavailable"""
+    try:
+        storage = StorageClient()
+    except Exception as e:
+        logger.warning("storage client unavailable, debug images disabled", error=str(e))
+        return None
+
+    # a minio outage at boot must not keep the service down, the check is
+    # retried on the first debug upload
+    try:
+        storage.ensure_bucket()
+    except Exception as e:
+        logger.warning("failed to ensure debug bucket", error=str(e))
+
+    logger.info("storage client initialized")
+    return storage
 
 
 app = FastAPI(
@@ -35,8 +61,12 @@ app = FastAPI(
     description="perspective alignment service for receipt images with observability",
     version="0.1.0",
     lifespan=lifespan,
+    # error and health bodies go through orjson, /align returns raw bytes
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(UploadSizeLimitMiddleware)
+
 instrument_app(app)
 
 app.include_router(health.router)
@@ -1,9 +1,14 @@
-from pydantic import BaseModel, Field
+from functools import cache, lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AlignmentConfig(BaseModel):
     """configuration for alignment algorithm"""
 
+    # instances are cached and shared between requests, see for_request and the presets
+    model_config = ConfigDict(frozen=True)
+
     mode: str = Field(
         default="classic",
         description="alignment mode: 'classic' for cv-based or 'neural' for nn-based detection",
@@ -28,6 +33,30 @@ class AlignmentConfig(BaseModel):
     recognition_id: str = Field(default="", description="recognition id for debug tracking")
 
     @classmethod
+    def for_request(
+        cls,
+        mode: str,
+        simplify_percent: float,
+        apply_ocr_preprocessing: bool,
+        aggressive: bool,
+        debug_mode: bool,
+        recognition_id: str = "",
+    ) -> "AlignmentConfig":
+        """
+        config for an api request
+
+        requests repeat a handful of parameter combos, so the validated config is
+        cached and only the per-request recognition id is copied in without revalidation
+        """
+        config = _cached_config(
+            mode, simplify_percent, apply_ocr_preprocessing, aggressive, debug_mode
+        )
+        if recognition_id:
+            config = config.model_copy(update={"recognition_id": recognition_id})
+        return config
+
+    @classmethod
+    @cache
     def default(cls) -> "AlignmentConfig":
         """default config - balanced classic mode"""
         return cls(
@@ -39,6 +68,7 @@ class AlignmentConfig(BaseModel):
         )
 
     @classmethod
+    @cache
     def neural(cls) -> "AlignmentConfig":
         """neural network based detection using docaligner"""
         return cls(
@@ -50,6 +80,7 @@ class AlignmentConfig(BaseModel):
         )
 
     @classmethod
+    @cache
     def for_high_quality(cls) -> "AlignmentConfig":
         """for high quality images - aggressive mode"""
         return cls(
@@ -61,6 +92,7 @@ class AlignmentConfig(BaseModel):
         )
 
     @classmethod
+    @cache
     def for_low_quality(cls) -> "AlignmentConfig":
         """for low quality images - gentle mode"""
         return cls(
@@ -70,3 +102,21 @@ class AlignmentConfig(BaseModel):
             aggressive=False,
             debug_mode=False,
         )
+
+
+@lru_cache(maxsize=16)
+def _cached_config(
+    mode: str,
+    simplify_percent: float,
+    apply_ocr_preprocessing: bool,
+    aggressive: bool,
+    debug_mode: bool,
+) -> AlignmentConfig:
+    """validated config per parameter combo"""
+    return AlignmentConfig(
+        mode=mode,
+        simplify_percent=simplify_percent,
+        apply_ocr_preprocessing=apply_ocr_preprocessing,
+        aggressive=aggressive,
+        debug_mode=debug_mode,
+    )
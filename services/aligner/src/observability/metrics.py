@@ -14,17 +14,36 @@ alignment_errors_total = Counter(
     ["error_type"],
 )
 
-# histograms
+# children for the known label values, bound once instead of a labels() lookup per call.
+# they also export zeroes from startup, so rate() has a baseline before the first error
+_request_counters = {
+    status: alignment_requests_total.labels(status=status) for status in ("success",)
+}
+_error_counters = {
+    error_type: alignment_errors_total.labels(error_type=error_type)
+    for error_type in (
+        "image_too_large",
+        "image_decode_error",
+        "timeout",
+        "alignment_error",
+        "unexpected",
+    )
+}
+
+# histograms, log-spaced buckets: each one a fixed ratio wider than the last,
+# so relative resolution is the same at every scale with few series per scrape
 alignment_duration_seconds = Histogram(
     "aligner_alignment_duration_seconds",
     "alignment processing duration in seconds",
-    buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+    # 50ms to ~51s in x4 steps, covers processing_timeout
+    buckets=tuple(0.05 * 4**i for i in range(6)),
 )
 
 image_size_bytes = Histogram(
     "aligner_image_size_bytes",
     "processed image size in bytes",
-    buckets=[1024, 10240, 102400, 1048576, 5242880, 10485760],
+    # 16KiB to 16MiB in x4 steps, covers max_image_size
+    buckets=tuple(1 << i for i in range(14, 25, 2)),
 )
 
 # gauges
@@ -32,6 +51,8 @@ active_alignments = Gauge(
     "aligner_active_alignments", "number of currently active alignment requests"
 )
 
+worker_pool_size = Gauge("aligner_worker_pool_size", "number of alignment thread pool workers")
+
 
 def metrics_endpoint() -> Response:
     """prometheus metrics endpoint"""
@@ -40,12 +61,18 @@ def metrics_endpoint() -> Response:
 
 def record_request(status: str) -> None:
     """record alignment request"""
-    alignment_requests_total.labels(status=status).inc()
+    counter = _request_counters.get(status)
+    if counter is None:
+        counter = alignment_requests_total.labels(status=status)
+    counter.inc()
 
 
 def record_error(error_type: str) -> None:
     """record alignment error"""
-    alignment_errors_total.labels(error_type=error_type).inc()
+    counter = _error_counters.get(error_type)
+    if counter is None:
+        counter = alignment_errors_total.labels(error_type=error_type)
+    counter.inc()
 
 
 def record_duration(duration: float) -> None:
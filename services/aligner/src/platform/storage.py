@@ -1,8 +1,12 @@
 import io
+import socket
 from datetime import timedelta
+from functools import lru_cache
 
+import urllib3
 from minio import Minio
 from minio.error import S3Error
+from urllib3.connection import HTTPConnection
 
 from ..config import settings
 from ..logger import get_logger
@@ -10,8 +14,14 @@ from ..logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _expiry_delta(seconds: int) -> timedelta:
+    """presign expiry, callers reuse a few fixed values"""
+    return timedelta(seconds=seconds)
+
+
 class StorageClient:
-    """minio storage client for debug images"""
+    """minio storage client for debug images, built once in lifespan"""
 
     def __init__(self):
         """initialize minio client"""
@@ -20,12 +30,39 @@ class StorageClient:
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_use_ssl,
+            http_client=self._build_http_client(),
         )
         self.bucket = settings.minio_bucket
-        self._ensure_bucket()
+        # set after the first successful check, later uploads skip the round-trip
+        self._bucket_ready = False
+
+    @staticmethod
+    def _build_http_client() -> urllib3.PoolManager:
+        """
+        connection pool for minio, mirrors the minio defaults
+
+        uploads run on the debug upload pool, so one kept-alive socket per upload thread
+        means a debug upload never waits for a new tcp (and tls) handshake
+        """
+        timeout = timedelta(minutes=5).seconds
+        return urllib3.PoolManager(
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            maxsize=max(10, settings.debug_upload_workers),
+            block=False,
+            retries=urllib3.Retry(
+                total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+            ),
+            socket_options=[
+                *HTTPConnection.default_socket_options,
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        )
+
+    def ensure_bucket(self):
+        """ensure bucket exists, checked once, retried on the next upload if it failed"""
+        if self._bucket_ready:
+            return
 
-    def _ensure_bucket(self):
-        """ensure bucket exists"""
         try:
             if not self.client.bucket_exists(self.bucket):
                 self.client.make_bucket(self.bucket)
@@ -36,6 +73,8 @@ class StorageClient:
             logger.error("failed to ensure bucket", error=str(e), bucket=self.bucket)
             raise
 
+        self._bucket_ready = True
+
     def put_object(self, key: str, data: bytes, content_type: str = "image/jpeg") -> str | None:
         """
         upload object to minio
@@ -49,6 +88,8 @@ class StorageClient:
             object url or none if failed
         """
         try:
+            self.ensure_bucket()
+
             # noinspection PyTypeChecker
             data_stream = io.BytesIO(data)
             self.client.put_object(
@@ -69,23 +110,8 @@ class StorageClient:
     def get_presigned_url(self, key: str, expiry: int = 3600) -> str | None:
         """get presigned url for object"""
         try:
-            url = self.client.presigned_get_object(
-                self.bucket, key, expires=timedelta(seconds=expiry)
-            )
+            url = self.client.presigned_get_object(self.bucket, key, expires=_expiry_delta(expiry))
             return url
         except S3Error as e:
             logger.error("failed to get presigned url", error=str(e), key=key)
             return None
-
-
-# singleton instance
-_storage_client: StorageClient | None = None
-
-
-def get_storage_client() -> StorageClient:
-    """get or create storage client singleton"""
-    global _storage_client
-    if _storage_client is None:
-        _storage_client = StorageClient()
-        logger.info("storage client initialized")
-    return _storage_client
@@ -1,6 +1,5 @@
 import time
-from collections import deque
-from collections.abc import Awaitable, Callable, Sequence
+from collections.abc import Callable, Sequence
 
 import cv2
 import numpy as np
@@ -19,6 +18,13 @@ from .debug_helper import DebugHelper
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
+# rows per float32 band when measuring color distance for the flood fill
+FILL_BAND_ROWS = 256
+
+# mask cleanup kernels, built once and only ever read
+KERNEL_SMALL = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+KERNEL_LARGE = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
+
 
 class AlignerService:
     """
@@ -30,11 +36,11 @@ class AlignerService:
     def __init__(self):
         logger.info("aligner service initialized")
 
-    async def align(
+    def align(
         self,
         image_array: np.ndarray,
         config: AlignmentConfig,
-        debug_callback: Callable[[str, int, np.ndarray, dict], Awaitable[None]] | None = None,
+        debug_callback: Callable[[str, int, np.ndarray, dict], None] | None = None,
     ) -> np.ndarray:
         start_time = time.time()
         debug = DebugHelper(debug_callback, config.debug_mode)
@@ -45,7 +51,7 @@ class AlignerService:
             span.set_attribute("config.debug_mode", config.debug_mode)
 
             try:
-                await debug.log(
+                debug.log(
                     "00_original",
                     image_array,
                     {
@@ -58,7 +64,7 @@ class AlignerService:
                 is_inverted, working_image = handle_dark_receipt(image_array)
                 span.set_attribute("preprocessing.inverted", is_inverted)
 
-                await debug.log(
+                debug.log(
                     "01_inverted" if is_inverted else "01_input",
                     working_image,
                     {
@@ -71,7 +77,7 @@ class AlignerService:
                 )
 
                 preprocessed = preprocess_illumination(working_image)
-                await debug.log(
+                debug.log(
                     "02_preprocessed",
                     preprocessed,
                     {
@@ -87,7 +93,7 @@ class AlignerService:
                     seed_vis = preprocessed.copy()
                     cv2.circle(seed_vis, seed_point, 20, (0, 0, 255), -1)
                     cv2.circle(seed_vis, seed_point, 22, (0, 255, 255), 2)
-                    await debug.log(
+                    debug.log(
                         "03_seed_point",
                         seed_vis,
                         {
@@ -100,7 +106,7 @@ class AlignerService:
 
                 mask = self._find_check_mask(preprocessed, seed_point)
 
-                mask_coverage = np.sum(mask > 0) / float(mask.shape[0] * mask.shape[1])
+                mask_coverage = cv2.countNonZero(mask) / float(mask.size)
                 span.set_attribute("mask.coverage", mask_coverage)
 
                 if mask_coverage > 0.85 or mask_coverage < 0.03:
@@ -108,7 +114,7 @@ class AlignerService:
 
                 if debug:
                     mask_vis = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
-                    await debug.log(
+                    debug.log(
                         "04_mask_raw",
                         mask_vis,
                         {
@@ -118,20 +124,20 @@ class AlignerService:
                         },
                     )
 
-                    kernel_large = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
-                    clean = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel_large)
-                    await debug.log(
+                # single cleanup pass, the debug steps show the same buffers the polygon uses
+                closed = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, KERNEL_LARGE)
+                clean = cv2.morphologyEx(closed, cv2.MORPH_OPEN, KERNEL_SMALL)
+
+                if debug:
+                    debug.log(
                         "05_mask_closed",
-                        cv2.cvtColor(clean, cv2.COLOR_GRAY2BGR),
+                        cv2.cvtColor(closed, cv2.COLOR_GRAY2BGR),
                         {
                             "description": "after morphological close (15x15)",
                             "method": "classic",
                         },
                     )
-
-                    kernel_small = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-                    clean = cv2.morphologyEx(clean, cv2.MORPH_OPEN, kernel_small)
-                    await debug.log(
+                    debug.log(
                         "06_mask_opened",
                         cv2.cvtColor(clean, cv2.COLOR_GRAY2BGR),
                         {
@@ -140,7 +146,7 @@ class AlignerService:
                         },
                     )
 
-                polygon = self._mask_to_polygon(mask, config.simplify_percent)
+                polygon = self._mask_to_polygon(clean, config.simplify_percent)
 
                 if debug:
                     contour_vis = image_array.copy()
@@ -157,7 +163,7 @@ class AlignerService:
                                 (255, 255, 255),
                                 2,
                             )
-                    await debug.log(
+                    debug.log(
                         "07_polygon_points",
                         contour_vis,
                         {
@@ -169,7 +175,7 @@ class AlignerService:
                     )
 
                 if len(polygon) > 0:
-                    polygon = self._ensure_receipt_shape(polygon, mask)
+                    polygon = self._ensure_receipt_shape(polygon, clean)
 
                 rect = cv2.minAreaRect(polygon)
                 corners = cv2.boxPoints(rect)
@@ -189,7 +195,7 @@ class AlignerService:
                             (255, 255, 0),
                             2,
                         )
-                    await debug.log(
+                    debug.log(
                         "08_corners_detected",
                         corners_vis,
                         {
@@ -202,7 +208,7 @@ class AlignerService:
 
                 corners = order_corners(corners)
                 warped = warp_perspective(image_array, corners)
-                await debug.log(
+                debug.log(
                     "09_warped",
                     warped,
                     {
@@ -264,39 +270,34 @@ class AlignerService:
 
         logger.debug("flood fill tolerance", value=float(tolerance))
 
-        mask = np.zeros((h, w), dtype=np.uint8)
-        visited = np.zeros((h, w), dtype=bool)
-        queue = deque([seed_point])
-        visited[seed_point[1], seed_point[0]] = True
-
-        dirs = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1)]
-
-        while queue:
-            x, y = queue.popleft()
-            color = image[y, x].astype(np.float32)
-
-            if self._color_distance(color, mean_color) <= tolerance:
-                alpha = 0.005
-                mean_color = mean_color * (1 - alpha) + color * alpha
-                mask[y, x] = 255
-
-                for dx, dy in dirs:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < w and 0 <= ny < h and not visited[ny, nx]:
-                        visited[ny, nx] = True
-                        queue.append((nx, ny))
-
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        return mask
-
-    def _mask_to_polygon(self, mask: np.ndarray, simplify_percent: float) -> np.ndarray:
-        kernel_large = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
-        clean = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel_large)
-        kernel_small = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
-        clean = cv2.morphologyEx(clean, cv2.MORPH_OPEN, kernel_small)
+        # pixels within tolerance of the seed color, then the 8-connected region of them
+        # around the seed. opencv's scanline fill replaces a per-pixel python bfs
+        # squared distance in row bands, so the float copy is a band, never the full frame
+        limit = tolerance * tolerance
+        within = np.empty((h, w), dtype=bool)
+        for y0 in range(0, h, FILL_BAND_ROWS):
+            diff = image[y0 : y0 + FILL_BAND_ROWS].astype(np.float32)
+            diff -= mean_color
+            diff *= diff
+            np.less_equal(diff.sum(axis=2), limit, out=within[y0 : y0 + FILL_BAND_ROWS])
+        within = within.view(np.uint8)
+
+        # floodfill wants a mask two pixels larger than the image
+        fill_mask = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        if within[seed_point[1], seed_point[0]]:
+            cv2.floodFill(
+                within,
+                fill_mask,
+                seed_point,
+                0,
+                loDiff=0,
+                upDiff=0,
+                flags=8 | cv2.FLOODFILL_MASK_ONLY | (255 << 8),
+            )
+        # raw fill, cleanup happens once in align() before the polygon is traced
+        return fill_mask[1:-1, 1:-1]
 
+    def _mask_to_polygon(self, clean: np.ndarray, simplify_percent: float) -> np.ndarray:
         contours, _ = cv2.findContours(clean, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
 
         if not contours:
@@ -352,61 +353,44 @@ class AlignerService:
 
     @staticmethod
     def _filter_sharp_angles(polygon: np.ndarray, min_angle_deg: float) -> np.ndarray:
-        filtered = []
         pts = polygon.squeeze()
 
         if len(pts.shape) == 1:
             return polygon
 
-        for i in range(len(pts)):
-            angle = AlignerService._compute_angle_at_point(pts, i)
-            if angle < 0:
-                angle += 360
-
-            if min_angle_deg < angle < (360 - min_angle_deg):
-                filtered.append(pts[i])
+        # interior angle at every vertex at once, from the directions to both neighbours
+        prev = np.roll(pts, 1, axis=0)
+        nxt = np.roll(pts, -1, axis=0)
+        angles = np.abs(
+            np.degrees(
+                np.arctan2(nxt[:, 1] - pts[:, 1], nxt[:, 0] - pts[:, 0])
+                - np.arctan2(prev[:, 1] - pts[:, 1], prev[:, 0] - pts[:, 0])
+            )
+        )
 
-        if len(filtered) < 4:
+        keep = (angles > min_angle_deg) & (angles < 360 - min_angle_deg)
+        if np.count_nonzero(keep) < 4:
             return polygon
 
-        return np.array(filtered, dtype=np.float32)
+        return pts[keep].astype(np.float32)
 
     @staticmethod
     def _get_samples(image: np.ndarray, center: tuple[int, int], radius: int) -> np.ndarray:
-        samples = []
+        # square patch around the center, clipped to the image, one row per pixel
         x, y = center
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                sample_y = y + dy
-                sample_x = x + dx
-                if 0 <= sample_y < image.shape[0] and 0 <= sample_x < image.shape[1]:
-                    samples.append(image[sample_y, sample_x])
-        return np.array(samples, dtype=np.float32)
-
-    @staticmethod
-    def _color_distance(a: np.ndarray, b: np.ndarray) -> float:
-        diff = a - b
-        return float(np.sqrt(np.sum(diff * diff)))
+        y0, y1 = max(0, y - radius), min(image.shape[0], y + radius + 1)
+        x0, x1 = max(0, x - radius), min(image.shape[1], x + radius + 1)
+        patch = image[y0:y1, x0:x1]
+        return patch.reshape(-1, *image.shape[2:]).astype(np.float32)
 
     def _compute_auto_tolerance(self, samples: np.ndarray, mean_color: np.ndarray) -> float:
-        variance = np.mean([self._color_distance(s, mean_color) for s in samples])
+        # mean euclidean distance of the samples to their mean color, in one pass
+        diff = samples - mean_color
+        variance = float(np.sqrt(np.sum(diff * diff, axis=1)).mean())
         brightness = mean_color[2] * 0.299 + mean_color[1] * 0.587 + mean_color[0] * 0.114
         tolerance = 13 + (255 - brightness) * 0.7 + variance * 0.7
         return float(np.clip(tolerance, 10, 65))
 
-    @staticmethod
-    def _compute_angle_at_point(pts: np.ndarray, index: int) -> float:
-        prev = pts[(index - 1) % len(pts)]
-        curr = pts[index]
-        next_pt = pts[(index + 1) % len(pts)]
-        angle = abs(
-            np.degrees(
-                np.arctan2(next_pt[1] - curr[1], next_pt[0] - curr[0])
-                - np.arctan2(prev[1] - curr[1], prev[0] - curr[0])
-            )
-        )
-        return float(angle)
-
     @staticmethod
     def shutdown():
         logger.info("shutting down aligner service")
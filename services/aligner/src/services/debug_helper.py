@@ -1,4 +1,4 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
@@ -7,22 +7,24 @@ import numpy as np
 class DebugHelper:
     """helper for clean debug visualization without polluting main logic"""
 
+    __slots__ = ("callback", "enabled", "step_counter")
+
     def __init__(
         self,
-        callback: Callable[[str, int, np.ndarray, dict], Awaitable[None]] | None,
+        callback: Callable[[str, int, np.ndarray, dict], None] | None,
         enabled: bool = False,
     ):
         self.callback = callback
         self.enabled = enabled and callback is not None
         self.step_counter = 0
 
-    async def log(self, step_name: str, image: np.ndarray, metadata: dict[str, Any] | None = None):
+    def log(self, step_name: str, image: np.ndarray, metadata: dict[str, Any] | None = None):
         """log debug step if enabled"""
         if not self.enabled:
             return
 
         meta = metadata or {}
-        await self.callback(step_name, self.step_counter, image.copy(), meta)
+        self.callback(step_name, self.step_counter, image.copy(), meta)
         self.step_counter += 1
 
     def __bool__(self):
@@ -1,5 +1,5 @@
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 
 import numpy as np
 
@@ -44,11 +44,11 @@ class HybridAligner:
         else:
             logger.info("hybrid aligner initialized without neural support")
 
-    async def align(
+    def align(
         self,
         image_array: np.ndarray,
         config: AlignmentConfig,
-        debug_callback: Callable[[str, int, np.ndarray, dict], Awaitable[None]] | None = None,
+        debug_callback: Callable[[str, int, np.ndarray, dict], None] | None = None,
     ) -> tuple[np.ndarray, np.ndarray]:
         start_time = time.time()
 
@@ -67,7 +67,7 @@ class HybridAligner:
             if try_neural:
                 try:
                     logger.info("attempting neural alignment via docaligner")
-                    warped = await self.neural_aligner.align(image_array, config, debug_callback)
+                    warped = self.neural_aligner.align(image_array, config, debug_callback)
                     used_method = "neural"
                     span.set_attribute("method.used", "neural")
                     span.set_attribute("method.fallback", False)
@@ -88,7 +88,7 @@ class HybridAligner:
 
                 fallback_callback = None if fallback_used else debug_callback
 
-                warped = await self.classic_aligner.align(image_array, config, fallback_callback)
+                warped = self.classic_aligner.align(image_array, config, fallback_callback)
                 used_method = "classic"
                 span.set_attribute("method.used", "classic")
 
@@ -1,5 +1,6 @@
+import logging
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 
 import cv2
 import numpy as np
@@ -55,11 +56,11 @@ class NeuralAligner:
             model_cfg=model_cfg,
         )
 
-    async def align(
+    def align(
         self,
         image_array: np.ndarray,
         config: AlignmentConfig,
-        debug_callback: Callable[[str, int, np.ndarray, dict], Awaitable[None]] | None = None,
+        debug_callback: Callable[[str, int, np.ndarray, dict], None] | None = None,
     ) -> np.ndarray:
         start_time = time.time()
         debug = DebugHelper(debug_callback, config.debug_mode)
@@ -69,7 +70,7 @@ class NeuralAligner:
             span.set_attribute("config.aggressive", config.aggressive)
 
             try:
-                await debug.log(
+                debug.log(
                     "00_original",
                     image_array,
                     {
@@ -90,7 +91,9 @@ class NeuralAligner:
                     "neural.corners_detected", len(polygon) if polygon is not None else 0
                 )
 
-                logger.info(f"neural aligner detected corners: {polygon}")
+                if polygon is not None and logger.is_enabled_for(logging.DEBUG):
+                    logger.debug("neural aligner detected corners", corners=polygon.tolist())
+
                 if polygon is None or len(polygon) != 4:
                     logger.warning(
                         "neural model failed to detect document corners",
@@ -99,7 +102,7 @@ class NeuralAligner:
                     raise ValueError("neural model could not detect document")
 
                 polygon_vis = self._draw_polygon_image(image_array, polygon)
-                await debug.log(
+                debug.log(
                     "02_corners_neural",
                     polygon_vis,
                     {
@@ -113,7 +116,7 @@ class NeuralAligner:
                 corners = order_corners(polygon)
 
                 warped = warp_perspective(image_array, corners)
-                await debug.log(
+                debug.log(
                     "03_warped",
                     warped,
                     {
@@ -101,13 +101,21 @@ export class AlignerClient {
                 searchParams.set('image_id', options.imageId)
             }
 
+            // warped jpeg and preprocessed png come back to back, split at x-warped-length
             const response = await this.api.post('api/v1/align', {
                 body: formData,
                 searchParams,
-            }).json<{warped: string, preprocessed: string}>()
+            })
+
+            const body = Buffer.from(await response.arrayBuffer())
+            const warpedLength = Number(response.headers.get('x-warped-length'))
+
+            if (!Number.isInteger(warpedLength) || warpedLength <= 0 || warpedLength >= body.length) {
+                throw new Error('malformed aligner response')
+            }
 
-            const warpedBuffer = Buffer.from(response.warped, 'base64')
-            const preprocessedBuffer = Buffer.from(response.preprocessed, 'base64')
+            const warpedBuffer = body.subarray(0, warpedLength)
+            const preprocessedBuffer = body.subarray(warpedLength)
 
             const duration = Date.now() - startTime
 
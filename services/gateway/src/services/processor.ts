@@ -123,8 +123,8 @@ export class RecognitionProcessor {
                     })
 
                     // publish preprocessed version
-                    const gatewayPrepKey = `debug/${recognitionId}/51_aligned_preprocessed.jpg`
-                    await this.storage.putObject(gatewayPrepKey, alignmentResult.preprocessed, 'image/jpeg')
+                    const gatewayPrepKey = `debug/${recognitionId}/51_aligned_preprocessed.png`
+                    await this.storage.putObject(gatewayPrepKey, alignmentResult.preprocessed, 'image/png')
 
                     await this.eventBus.publish('ocr:events', 'ocr.debug.step', {
                         recognitionId,
@@ -159,8 +159,8 @@ export class RecognitionProcessor {
                         description: 'alignment failed - using original',
                     })
 
-                    const fallbackPrepKey = `debug/${recognitionId}/51_fallback_preprocessed.jpg`
-                    await this.storage.putObject(fallbackPrepKey, localPreprocessed, 'image/jpeg')
+                    const fallbackPrepKey = `debug/${recognitionId}/51_fallback_preprocessed.png`
+                    await this.storage.putObject(fallbackPrepKey, localPreprocessed, 'image/png')
 
                     await this.eventBus.publish('ocr:events', 'ocr.debug.step', {
                         recognitionId,
@@ -414,8 +414,12 @@ export class RecognitionProcessor {
                     })
 
                     if (this.config.debugMode) {
-                        const winnerKey = `debug/${recognitionId}/60_ocr_winner_${attempt.engine}.jpg`
-                        await this.storage.putObject(winnerKey, attempt.buffer, 'image/jpeg')
+                        // preprocessed buffers are png (aligner or local fallback), warped ones jpeg
+                        const [winnerExt, winnerType] = attempt.usedPreprocessed
+                            ? ['png', 'image/png']
+                            : ['jpg', 'image/jpeg']
+                        const winnerKey = `debug/${recognitionId}/60_ocr_winner_${attempt.engine}.${winnerExt}`
+                        await this.storage.putObject(winnerKey, attempt.buffer, winnerType)
 
                         await this.eventBus.publish('ocr:events', 'ocr.debug.step', {
                             recognitionId,
@@ -496,7 +500,8 @@ export class RecognitionProcessor {
                 .grayscale()
                 .normalize()
                 .threshold(128, { grayscale: true })
-                .jpeg({ quality: 95 })
+                // png like the aligner's preprocessed output, a thresholded page is lossless and small
+                .png()
                 .toBuffer()
 
             this.logger.debug('local preprocessing applied')
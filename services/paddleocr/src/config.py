@@ -23,12 +23,21 @@ class Settings(BaseSettings):
     paddle_use_angle_cls: bool = Field(default=True, description="use angle classification")
     paddle_use_gpu: bool = Field(default=False, description="use gpu for inference")
     paddle_show_log: bool = Field(default=False, description="show paddle logs")
+    paddle_enable_hpi: bool = Field(
+        default=False,
+        description="high-performance inference backend (needs hpi deps installed)",
+    )
 
     # processing
     max_image_size: int = Field(
         default=10 * 1024 * 1024, description="max image size in bytes (10mb)"
     )
     processing_timeout: float = Field(default=30.0, description="processing timeout in seconds")
+    max_decode_edge: int = Field(
+        default=1920,
+        ge=0,
+        description="longest edge jpegs are decoded at via draft mode (0 to disable)",
+    )
 
     # logging
     log_level: str = Field(default="INFO", description="logging level")
@@ -1,24 +1,28 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import health, ocr
-from .dependencies import OCRServiceDependency
 from .logger import configure_logging, get_logger
 from .observability.telemetry import configure_telemetry, instrument_app
+from .services import OCRService
 
 configure_logging()
 logger = get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     """application lifecycle manager"""
     logger.info("starting paddleocr service")
 
-    # startup
+    # startup: build models before the first request instead of during it
     configure_telemetry()
-    OCRServiceDependency.get_instance()
+    logger.info("creating ocr service instance")
+    app.state.ocr_service = OCRService()
+    logger.info("ocr service created")
+    app.state.ocr_service.warmup()
 
     logger.info("service ready")
 
@@ -26,7 +30,8 @@ async def lifespan(_app: FastAPI):
 
     # shutdown
     logger.info("shutting down service")
-    OCRServiceDependency.shutdown()
+    logger.info("shutting down ocr service")
+    app.state.ocr_service.shutdown()
     logger.info("service stopped")
 
 
@@ -35,6 +40,8 @@ app = FastAPI(
     description="OCR recognition service using PaddleOCR with observability",
     version="0.1.0",
     lifespan=lifespan,
+    # responses carry a bbox and score per text block, orjson encodes them in c
+    default_response_class=ORJSONResponse,
 )
 
 instrument_app(app)
@@ -1,17 +1,24 @@
 import asyncio
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from paddleocr import PaddleOCR
+from PIL import Image, ImageDraw
 
 from ..config import settings
 from ..logger import get_logger
 from ..observability.telemetry import get_tracer
 
+if TYPE_CHECKING:
+    from paddleocr import PaddleOCR
+
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
+# portrait 3:4 canvases in the size range phone receipt photos land in after decode
+WARMUP_SHAPES = ((640, 480), (1920, 1440))
+
 
 class OCRService:
     """service for paddleocr"""
@@ -23,18 +30,23 @@ class OCRService:
         logger.info("ocr service initialized")
 
     @staticmethod
-    def _init_paddle() -> PaddleOCR:
+    def _init_paddle() -> "PaddleOCR":
         """initialize paddleocr with configured settings"""
+        # imported here so loading the module does not pull in paddle
+        from paddleocr import PaddleOCR
+
         logger.info(
             "initializing paddleocr",
             device=settings.paddle_device,
             lang=settings.paddle_lang,
             use_gpu=settings.paddle_use_gpu,
+            enable_hpi=settings.paddle_enable_hpi,
         )
 
         ocr = PaddleOCR(
             device=settings.paddle_device,
             lang=settings.paddle_lang,
+            enable_hpi=settings.paddle_enable_hpi,
         )
 
         logger.info("paddleocr initialized successfully")
@@ -45,12 +57,32 @@ class OCRService:
         with tracer.start_as_current_span("ocr_service.recognize") as span:
             span.set_attribute("image.shape", str(image_array.shape))
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(self.executor, self.ocr.predict, image_array)
 
             logger.debug("ocr prediction completed", results_count=len(result))
             return result
 
+    def warmup(self):
+        """run synthetic receipts through the pipeline so lazy predictor setup happens at startup"""
+        start_time = time.perf_counter()
+        try:
+            for height, width in WARMUP_SHAPES:
+                # a line of text so recognition runs too, not just detection.
+                # ascii only: pil's bundled default font has no cyrillic glyphs and the
+                # image ships no other ttf, so cyrillic would render as empty boxes
+                image = Image.new("RGB", (width, height), "white")
+                draw = ImageDraw.Draw(image)
+                draw.text((width // 8, height // 2), "TOTAL 123.45", fill="black", font_size=32)
+                self.ocr.predict(np.asarray(image))
+            logger.info(
+                "ocr warmup completed",
+                shapes=len(WARMUP_SHAPES),
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+            )
+        except Exception as e:
+            logger.warning("ocr warmup failed", error=str(e))
+
     def shutdown(self):
         """cleanup resources"""
         if self.executor:
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from typing import Annotated
 
 import cv2
 import numpy as np
@@ -26,12 +27,12 @@ router = APIRouter(prefix="/api/v1", tags=["ocr"])
 
 @router.post("/recognize", response_model=OCRResult)
 async def recognize_text(
-    image: UploadFile = File(...),
-    lang: str = Query(
-        default=settings.default_lang,
-        description="language code(s) for ocr, e.g. 'rus', 'eng', 'rus+eng'",
-    ),
-    tesseract_deps: TesseractServiceDep = None,
+    image: Annotated[UploadFile, File()],
+    tesseract_service: TesseractServiceDep,
+    lang: Annotated[
+        str,
+        Query(description="language code(s) for ocr, e.g. 'rus', 'eng', 'rus+eng'"),
+    ] = settings.default_lang,
 ):
     """
     recognize text from uploaded image using tesseract
@@ -42,7 +43,6 @@ async def recognize_text(
     parameters:
     - lang: language(s) for recognition (use '+' for multiple, e.g. 'rus+eng')
     """
-    tesseract_service, _ = tesseract_deps
     start_time = time.time()
     active_recognitions.inc()
 
@@ -63,8 +63,14 @@ async def recognize_text(
 
         # decode image
         try:
+            # tesseract only reads luminance, decode straight to grayscale
+            # instead of a bgr decode followed by a separate conversion.
+            # decoding is cpu bound so it runs off the event loop, on the service
+            # pool so settings.workers caps it together with recognition
             nparr = np.frombuffer(contents, np.uint8)
-            img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            img = await asyncio.get_running_loop().run_in_executor(
+                tesseract_service.executor, cv2.imdecode, nparr, cv2.IMREAD_GRAYSCALE
+            )
             if img is None:
                 raise ValueError("failed to decode image")
         except Exception as e:
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -53,5 +55,10 @@ class Settings(BaseSettings):
     # metrics
     enable_metrics: bool = Field(default=True, description="enable prometheus metrics")
 
+    @cached_property
+    def tesseract_config(self) -> str:
+        """tesseract cli flags, built once instead of per request"""
+        return f"--psm {self.psm} --oem {self.oem}"
+
 
 settings = Settings()
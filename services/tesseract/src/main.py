@@ -1,24 +1,27 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import health, ocr
-from .dependencies import TesseractServiceDependency
 from .logger import configure_logging, get_logger
 from .observability.telemetry import configure_telemetry, instrument_app
+from .services import TesseractService
 
 configure_logging()
 logger = get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI):
+async def lifespan(app: FastAPI):
     """application lifecycle manager"""
     logger.info("starting tesseract service")
 
-    # startup
+    # startup: verify tesseract before the first request instead of during it
     configure_telemetry()
-    TesseractServiceDependency.get_instance()
+    logger.info("creating tesseract service instance")
+    app.state.tesseract_service = TesseractService()
+    logger.info("tesseract service created")
 
     logger.info("service ready")
 
@@ -26,7 +29,8 @@ async def lifespan(_app: FastAPI):
 
     # shutdown
     logger.info("shutting down service")
-    TesseractServiceDependency.shutdown()
+    logger.info("shutting down tesseract service")
+    app.state.tesseract_service.shutdown()
     logger.info("service stopped")
 
 
@@ -35,6 +39,8 @@ app = FastAPI(
     description="ocr recognition service using tesseract with observability",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson renders responses in c, including long non-ascii recognized text
+    default_response_class=ORJSONResponse,
 )
 
 instrument_app(app)
@@ -1,4 +1,6 @@
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
@@ -49,8 +51,11 @@ class TesseractService:
             logger.error("failed to initialize tesseract", error=str(e))
             raise RuntimeError(f"tesseract not available: {e}") from e
 
-    @staticmethod
+        # pytesseract blocks on a subprocess, keep it off the event loop
+        self.executor = ThreadPoolExecutor(max_workers=settings.workers)
+
     async def recognize(
+        self,
         image_array: np.ndarray,
         lang: str | None = None,
     ) -> OCRResult:
@@ -75,43 +80,22 @@ class TesseractService:
             span.set_attribute("ocr.psm", settings.psm)
 
             try:
-                # convert numpy array to PIL Image for pytesseract
-                # tesseract works better с grayscale
-                if len(image_array.shape) == 3:
-                    gray = cv2.cvtColor(image_array, cv2.COLOR_BGR2GRAY)
-                else:
-                    gray = image_array
-
-                pil_image = Image.fromarray(gray)
-
-                # configure tesseract
-                config = f"--psm {settings.psm} --oem {settings.oem}"
-
-                # get detailed data with confidence scores
-                data = pytesseract.image_to_data(
-                    pil_image,
-                    lang=language,
-                    config=config,
-                    output_type=pytesseract.Output.DICT,
+                data = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self._image_to_data, image_array, language
                 )
 
-                # extract text and calculate average confidence
-                text_parts = []
-                confidences = []
+                # extract text and calculate average confidence over all words at once
+                confidences = np.asarray(data["conf"], dtype=float)
+                words = np.char.strip(np.asarray(data["text"], dtype=str))
 
-                for i, conf in enumerate(data["conf"]):
-                    # pytesseract returns -1 for empty blocks
-                    if conf > 0:
-                        text = data["text"][i].strip()
-                        if text:
-                            text_parts.append(text)
-                            confidences.append(float(conf))
+                # pytesseract returns -1 for empty blocks
+                mask = (confidences > 0) & (words != "")
 
                 # join text with spaces (pytesseract breaks words)
-                full_text = " ".join(text_parts)
+                full_text = " ".join(words[mask].tolist())
 
                 # calculate average confidence
-                avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+                avg_confidence = float(confidences[mask].mean()) if mask.any() else 0.0
                 avg_confidence = avg_confidence / 100.0
 
                 duration = (time.time() - start_time) * 1000
@@ -127,7 +111,8 @@ class TesseractService:
                     language=language,
                 )
 
-                return OCRResult(
+                # values are built here from tesseract output, skip re-validation
+                return OCRResult.model_construct(
                     text=full_text,
                     confidence=avg_confidence,  # 0.0-1.0
                 )
@@ -136,6 +121,26 @@ class TesseractService:
                 raise RuntimeError(f"tesseract recognition failed: {e}") from e
 
     @staticmethod
-    def shutdown():
+    def _image_to_data(image_array: np.ndarray, language: str) -> dict:
+        """blocking tesseract call, runs in the service thread pool"""
+        # convert numpy array to PIL Image for pytesseract
+        # tesseract works better с grayscale
+        if len(image_array.shape) == 3:
+            gray = cv2.cvtColor(image_array, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = image_array
+
+        pil_image = Image.fromarray(gray)
+
+        # get detailed data with confidence scores
+        return pytesseract.image_to_data(
+            pil_image,
+            lang=language,
+            config=settings.tesseract_config,
+            output_type=pytesseract.Output.DICT,
+        )
+
+    def shutdown(self):
         """cleanup resources"""
-        logger.info("shutting down tesseract service")
+        logger.info("shutting down tesseract service executor")
+        self.executor.shutdown(wait=True)
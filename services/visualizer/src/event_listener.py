@@ -1,10 +1,10 @@
-import json
 import threading
 import time
 from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
+import orjson
 import redis
 
 from .config import settings
@@ -14,7 +14,8 @@ class EventListener:
     """listens to redis events and maintains job state"""
 
     def __init__(self):
-        self.redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+        # payloads stay bytes, orjson parses them without a str decode first
+        self.redis_client = redis.from_url(settings.redis_url)
         self.pubsub = self.redis_client.pubsub()
         self.pubsub.subscribe("ocr:events")
 
@@ -51,11 +52,11 @@ class EventListener:
                 message = self.pubsub.get_message(timeout=1.0)
                 if message and message["type"] == "message":
                     try:
-                        data = json.loads(message["data"])
+                        data = orjson.loads(message["data"])
                         event_name = data.get("event")
                         if event_name:
                             self._handle_event(event_name, data)
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         pass
             except Exception:
                 pass
@@ -1,7 +1,10 @@
 from io import BytesIO
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class GatewayClient:
@@ -11,6 +14,16 @@ class GatewayClient:
         self.gateway_url = gateway_url.rstrip("/")
         self.session = requests.Session()
 
+        # keep-alive pool sized for streamlit's script threads, connection errors on
+        # idempotent calls (status polling) are retried, uploads are not
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def upload_image(
         self,
         image_file: BytesIO,
@@ -55,7 +68,7 @@ class GatewayClient:
             )
 
             if response.status_code == 202:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 return None
 
@@ -79,7 +92,7 @@ class GatewayClient:
             )
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 return None
 
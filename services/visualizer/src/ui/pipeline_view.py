@@ -7,10 +7,12 @@ from ..deepseek_client import DeepSeekClient
 from ..storage_client import StorageClient
 from .utils import format_duration, format_timestamp, get_status_emoji
 
+STEP_PREFIX_PATTERN = re.compile(r"^\d+_(.+)$")
+
 
 def _clean_step_name(step: str) -> str:
     """extract clean step name without numeric prefix"""
-    match = re.match(r"^\d+_(.+)$", step)
+    match = STEP_PREFIX_PATTERN.match(step)
     if match:
         return match.group(1).replace("_", " ").title()
     return step.replace("_", " ").title()
@@ -1,5 +1,3 @@
-from io import BytesIO
-
 import streamlit as st
 
 from ..gateway_client import GatewayClient
@@ -86,10 +84,11 @@ def render_upload_form(gateway: GatewayClient) -> bool:
                 accepted_qr_formats.append("unknown")
 
             with st.spinner("uploading..."):
+                # streamlit's UploadedFile is already a BytesIO, send it without copying
                 uploaded_file.seek(0)
 
                 result = gateway.upload_image(
-                    image_file=BytesIO(uploaded_file.read()),
+                    image_file=uploaded_file,
                     filename=uploaded_file.name,
                     source_service=source_service,
                     source_reference=source_reference,